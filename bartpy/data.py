@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 
 from bartpy.errors import NoSplittableVariableException
+from bartpy.kernels import masked_sum, min_max_normalize, min_max_unnormalize
 from bartpy.splitcondition import SplitCondition
 
 
@@ -214,13 +215,12 @@ class Target(object):
     def __init__(self, y, mask, n_obsv, normalize, y_sum=None):
 
         if normalize:
-            self.original_y_min, self.original_y_max = y.min(), y.max()
-            self._y = self.normalize_y(y)
+            self._y, self.original_y_min, self.original_y_max = min_max_normalize(np.ascontiguousarray(y, dtype=np.float64))
+            self.normalizing_scale = self.original_y_max - self.original_y_min
         else:
             self._y = y
 
         self._mask = mask
-        self._inverse_mask_int = (~self._mask).astype(int)
         self._n_obsv = n_obsv
 
         if y_sum is None:
@@ -249,27 +249,25 @@ class Target(object):
         >>> Data.normalize_y([1, 2, 3])
         array([-0.5,  0. ,  0.5])
         """
-        y_min, y_max = np.min(y), np.max(y)
-        return -0.5 + ((y - y_min) / (y_max - y_min))
+        normalized_y, _, _ = min_max_normalize(np.ascontiguousarray(y, dtype=np.float64))
+        return normalized_y
 
     def unnormalize_y(self, y: np.ndarray) -> np.ndarray:
-        distance_from_min = y - (-0.5)
-        total_distance = (self.original_y_max - self.original_y_min)
-        return self.original_y_min + (distance_from_min * total_distance)
+        y = np.asarray(y, dtype=np.float64)
+        if y.ndim == 0:
+            return (y + 0.5) * (self.original_y_max - self.original_y_min) + self.original_y_min
+        unnormalized_y = min_max_unnormalize(np.ascontiguousarray(y.reshape(-1)), self.original_y_min, self.original_y_max)
+        return unnormalized_y.reshape(y.shape)
 
     @property
     def unnormalized_y(self) -> np.ndarray:
         return self.unnormalize_y(self.values)
 
-    @property
-    def normalizing_scale(self) -> float:
-        return self.original_y_max - self.original_y_min
-
     def summed_y(self) -> float:
         if self.y_sum_cache_up_to_date:
             return self._summed_y
         else:
-            self._summed_y = np.sum(self._y * self._inverse_mask_int)
+            self._summed_y = masked_sum(np.asarray(self._y), self._mask)
             self.y_sum_cache_up_to_date = True
             return self._summed_y
 
@@ -310,11 +308,11 @@ class Data(object):
                  n_obsv: int=None):
 
         if mask is None:
-            mask = np.zeros_like(y).astype(bool)
+            mask = np.zeros(len(y), dtype=bool)
         self._mask: np.ndarray = mask
 
         if n_obsv is None:
-            n_obsv = (~self.mask).astype(int).sum()
+            n_obsv = len(self.mask) - np.count_nonzero(self.mask)
 
         self._n_obsv = n_obsv
 
@@ -336,6 +334,23 @@ class Data(object):
     def update_y(self, y: np.ndarray) -> None:
         self._y.update_y(y)
 
+    def shallow_copy(self) -> 'Data':
+        """
+        Create a new Data object backed by the same covariate and target arrays
+        The copy's target can be updated independently, but no rows are duplicated
+
+        Returns
+        -------
+        Data
+        """
+        return Data(self.X.values,
+                    self.y.values,
+                    self.mask,
+                    normalize=False,
+                    unique_columns=self._X._unique_columns,
+                    splittable_variables=self._X._splittable_variables,
+                    n_obsv=self._n_obsv)
+
     def __add__(self, other: SplitCondition) -> 'Data':
         updated_mask = self.X.update_mask(other)
 
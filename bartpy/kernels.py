@@ -0,0 +1,84 @@
+"""
+Compiled numerical kernels used on the hot path of sampling
+"""
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def masked_sum(y: np.ndarray, mask: np.ndarray) -> float:
+    """
+    Sum the values of y that are not masked out, in a single pass without allocating any temporaries
+
+    Parameters
+    ----------
+    y: np.ndarray
+        The array to sum
+    mask: np.ndarray
+        Boolean array, True where the value should be excluded from the sum
+
+    Returns
+    -------
+    float
+    """
+    s = 0.0
+    for i in range(y.shape[0]):
+        if not mask[i]:
+            s += y[i]
+    return s
+
+
+@njit(cache=True, error_model="numpy")
+def min_max_normalize(y: np.ndarray) -> Tuple[np.ndarray, float, float]:
+    """
+    Map y into the range (-0.5, 0.5), finding the bounds of y along the way
+
+    Parameters
+    ----------
+    y: np.ndarray
+        Contiguous float64 array to normalize
+
+    Returns
+    -------
+    Tuple[np.ndarray, float, float]
+        The normalized array, the minimum of y and the maximum of y
+        As with `np.min` and `np.max`, a NaN anywhere in y makes the bounds and the whole result NaN
+
+    Raises
+    ------
+    ValueError
+        If y is empty
+    """
+    if y.shape[0] == 0:
+        raise ValueError("Cannot normalize an empty array")
+    y_min = y[0]
+    y_max = y[0]
+    for i in range(y.shape[0]):
+        value = y[i]
+        if np.isnan(value):
+            y_min = np.nan
+            y_max = np.nan
+            break
+        if value < y_min:
+            y_min = value
+        if value > y_max:
+            y_max = value
+    scale = 1.0 / (y_max - y_min)
+    normalized_y = np.empty_like(y)
+    for i in range(y.shape[0]):
+        normalized_y[i] = (y[i] - y_min) * scale - 0.5
+    return normalized_y, y_min, y_max
+
+
+@njit(cache=True)
+def min_max_unnormalize(y: np.ndarray, y_min: float, y_max: float) -> np.ndarray:
+    """
+    Inverse of `min_max_normalize`, maps y from (-0.5, 0.5) back onto (y_min, y_max)
+    """
+    scale = y_max - y_min
+    unnormalized_y = np.empty_like(y)
+    for i in range(y.shape[0]):
+        unnormalized_y[i] = (y[i] + 0.5) * scale + y_min
+    return unnormalized_y
@@ -1,3 +1,4 @@
+import math
 from copy import deepcopy, copy
 from typing import List, Generator, Optional
 
@@ -40,9 +41,10 @@ class Model:
         else:
             self.n_trees = len(trees)
             self._trees = trees
+        self._inv_sqrt_n_trees = 1. / math.sqrt(self.n_trees)
 
     def initialize_trees(self) -> List[Tree]:
-        trees = [Tree([LeafNode(Split(deepcopy(self.data)))]) for _ in range(self.n_trees)]
+        trees = [Tree([LeafNode(Split(self.data.shallow_copy()))]) for _ in range(self.n_trees)]
         for tree in trees:
             tree.update_y(tree.update_y(self.data.y.values / self.n_trees))
         return trees
@@ -81,6 +83,10 @@ class Model:
     def sigma_m(self) -> float:
         return 0.5 / (self.k * np.power(self.n_trees, 0.5))
 
+    @property
+    def inv_sqrt_n_trees(self) -> float:
+        return self._inv_sqrt_n_trees
+
     @property
     def sigma(self) -> Sigma:
         return self._sigma
@@ -1,3 +1,5 @@
+from typing import List
+
 import numpy as np
 
 from bartpy.model import Model
@@ -15,35 +17,36 @@ class LeafNodeSampler(Sampler):
     """
 
     def __init__(self,
-                 scalar_sampler=NormalScalarSampler(60000)):
+                 scalar_sampler=NormalScalarSampler(262144)):
         self._scalar_sampler = scalar_sampler
 
+    def reset(self) -> None:
+        self._scalar_sampler.reset()
+
     def step(self, model: Model, node: LeafNode) -> float:
         sampled_value = self.sample(model, node)
         node.set_value(sampled_value)
         return sampled_value
 
+    def step_batch(self, model: Model, nodes: List[LeafNode]) -> np.ndarray:
+        sampled_values = self.sample_batch(model, nodes)
+        for node, sampled_value in zip(nodes, sampled_values):
+            node.set_value(sampled_value)
+        return sampled_values
+
     def sample(self, model: Model, node: LeafNode) -> float:
+        return self.sample_batch(model, [node])[0]
+
+    def sample_batch(self, model: Model, nodes: List[LeafNode]) -> np.ndarray:
+        """
+        Sample new values for a set of leaf nodes, typically all of the leaf nodes of a tree
+        Computes the posterior for every node in one set of array operations rather than node by node
+        """
         prior_var = model.sigma_m ** 2
-        n = node.data.X.n_obsv
+        n = np.fromiter((node.data.X.n_obsv for node in nodes), dtype=np.float64, count=len(nodes))
+        summed_y = np.fromiter((node.data.y.summed_y() for node in nodes), dtype=np.float64, count=len(nodes))
         likihood_var = (model.sigma.current_value() ** 2) / n
-        likihood_mean = node.data.y.summed_y() / n
+        likihood_mean = summed_y / n
         posterior_variance = 1. / (1. / prior_var + 1. / likihood_var)
         posterior_mean = likihood_mean * (prior_var / (likihood_var + prior_var))
-        return posterior_mean + (self._scalar_sampler.sample() * np.power(posterior_variance / model.n_trees, 0.5))
-
-
-# class VectorizedLeafNodeSampler(Sampler):
-
-#     def step(self, model: Model, nodes: List[LeafNode]) -> float:
-#         sampled_values = self.sample(model, nodes)
-#         for (node, sample) in zip(nodes, sampled_values):
-#             node.set_value(sample)
-#         return sampled_values[0]
-
-#     def sample(self, model: Model, nodes: List[LeafNode]) -> List[float]:
-#         prior_var = model.sigma_m ** 2
-#         n_s = []
-#         sum_s = []
-        
-
+        return posterior_mean + (self._scalar_sampler.sample(len(nodes)) * np.sqrt(posterior_variance) * model.inv_sqrt_n_trees)
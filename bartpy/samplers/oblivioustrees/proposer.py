@@ -29,6 +29,9 @@ class UniformMutationProposer(TreeMutationProposer):
                                               [p_grow, p_prune],
                                               cache_size=1000)
 
+    def reset(self) -> None:
+        self.method_sampler.reset()
+
     def propose(self, tree: Tree) -> TreeMutation:
         method = self.method_sampler.sample()
         try:
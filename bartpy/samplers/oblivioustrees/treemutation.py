@@ -37,6 +37,10 @@ class UnconstrainedTreeMutationSampler(Sampler):
         self.likihood_ratio = likihood_ratio
         self._scalar_sampler = scalar_sampler
 
+    def reset(self) -> None:
+        self.proposer.reset()
+        self._scalar_sampler.reset()
+
     def sample(self, model: Model, tree: Tree) -> Optional[List[TreeMutation]]:
         proposals: List[TreeMutation] = self.proposer.propose(tree)
         ratio = np.sum([self.likihood_ratio.log_probability_ratio(model, tree, x) for x in proposals])
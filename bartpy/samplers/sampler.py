@@ -9,3 +9,9 @@ class Sampler(ABC):
     @abstractmethod
     def step(self, model: Model, tree: Tree) -> bool:
         raise NotImplementedError()
+
+    def reset(self) -> None:
+        """
+        Discard any cached random draws, so that subsequent draws come from the current random state
+        """
+        pass
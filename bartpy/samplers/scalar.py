@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, List, Optional
 
 import numpy as np
 
@@ -8,15 +8,29 @@ class NormalScalarSampler():
     def __init__(self,
                  cache_size: int=1000):
         self._cache_size = cache_size
-        self._cache = []
-
-    def sample(self):
-        if len(self._cache) == 0:
-            self.refresh_cache()
-        return self._cache.pop()
-
-    def refresh_cache(self):
-        self._cache = list(np.random.normal(size=self._cache_size))
+        self._cache = np.empty(0)
+        self._cursor = 0
+
+    def sample(self, n: Optional[int]=None):
+        if n is None:
+            if self._cursor >= len(self._cache):
+                self.refresh_cache()
+            value = self._cache[self._cursor]
+            self._cursor += 1
+            return value
+        if self._cursor + n > len(self._cache):
+            self.refresh_cache(n)
+        draws = self._cache[self._cursor:self._cursor + n]
+        self._cursor += n
+        return draws
+
+    def refresh_cache(self, min_size: int=0):
+        self._cache = np.random.normal(size=max(self._cache_size, min_size))
+        self._cursor = 0
+
+    def reset(self):
+        self._cache = np.empty(0)
+        self._cursor = 0
 
 
 class UniformScalarSampler():
@@ -34,6 +48,9 @@ class UniformScalarSampler():
     def refresh_cache(self):
         self._cache = list(np.random.uniform(size=self._cache_size))
 
+    def reset(self):
+        self._cache = []
+
 
 class DiscreteSampler():
 
@@ -55,3 +72,6 @@ class DiscreteSampler():
 
     def refresh_cache(self):
         self._cache = list(np.random.choice(self._values, p=self._probas, size=self._cache_size))
+
+    def reset(self):
+        self._cache = []
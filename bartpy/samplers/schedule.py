@@ -33,6 +33,15 @@ class SampleSchedule:
         self.sigma_sampler = sigma_sampler
         self.tree_sampler = tree_sampler
 
+    def reset(self) -> None:
+        """
+        Discard the cached random draws of all of the samplers in the schedule
+        Needed when a schedule is copied into a new chain, otherwise the copy replays the cached draws of the original
+        """
+        self.tree_sampler.reset()
+        self.leaf_sampler.reset()
+        self.sigma_sampler.reset()
+
     def steps(self, model: Model) -> Generator[Tuple[Text, Callable[[], float]], None, None]:
         """
         Create a generator of the steps that need to be called to complete a full Gibbs sample
@@ -49,7 +58,5 @@ class SampleSchedule:
         """
         for tree in model.refreshed_trees():
             yield "Tree", lambda: self.tree_sampler.step(model, tree)
-
-            for leaf_node in tree.leaf_nodes:
-                yield "Node", lambda: self.leaf_sampler.step(model, leaf_node)
+            yield "Node", lambda: self.leaf_sampler.step_batch(model, tree.leaf_nodes)
         yield "Node", lambda: self.sigma_sampler.step(model, model.sigma)
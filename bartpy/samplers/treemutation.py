@@ -48,6 +48,12 @@ class TreeMutationProposer(ABC):
         """
         raise NotImplementedError()
 
+    def reset(self) -> None:
+        """
+        Discard any cached random draws, so that subsequent draws come from the current random state
+        """
+        pass
+
 
 class TreeMutationLikihoodRatio(ABC):
     """
@@ -40,6 +40,9 @@ class UniformMutationProposer(TreeMutationProposer):
                                               list(self.prob_method_lookup.values()),
                                               cache_size=1000)
 
+    def reset(self) -> None:
+        self.method_sampler.reset()
+
     def propose(self, tree: Tree) -> TreeMutation:
         method = self.method_sampler.sample()
         try:
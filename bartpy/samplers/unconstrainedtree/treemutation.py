@@ -35,6 +35,10 @@ class UnconstrainedTreeMutationSampler(Sampler):
         self.likihood_ratio = likihood_ratio
         self._scalar_sampler = scalar_sampler
 
+    def reset(self) -> None:
+        self.proposer.reset()
+        self._scalar_sampler.reset()
+
     def sample(self, model: Model, tree: Tree) -> Optional[TreeMutation]:
         proposal = self.proposer.propose(tree)
         ratio = self.likihood_ratio.log_probability_ratio(model, tree, proposal)
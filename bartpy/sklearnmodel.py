@@ -1,9 +1,10 @@
+import math
 from copy import deepcopy
 from typing import List, Callable, Mapping, Union, Optional
 
 import numpy as np
 import pandas as pd
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.base import RegressorMixin, BaseEstimator
 
 from bartpy.data import Data
@@ -19,13 +20,24 @@ from bartpy.samplers.unconstrainedtree.treemutation import get_tree_sampler
 from bartpy.sigma import Sigma
 
 
-def run_chain(model: 'SklearnModel', X: np.ndarray, y: np.ndarray):
+def run_chain(model: 'SklearnModel', seed: Optional[np.random.SeedSequence]=None):
     """
     Run a single chain for a model
     Primarily used as a building block for constructing a parallel run of multiple chains
+
+    The chain samples a private copy of the already constructed `model.model` using a private copy of `model.sampler`,
+    so chains sharing a process (e.g. under a threading backend) never mutate each other's state or sampler caches
+
+    If a seed is passed, the random state of the process is reset from it before sampling
+    so that chains running in separate workers draw independent streams.
+    The cached draws of the chain's samplers are discarded either way, as they are copied from the original samplers
     """
-    model.model = model._construct_model(X, y)
-    return model.sampler.samples(model.model,
+    if seed is not None:
+        np.random.seed(seed.generate_state(1)[0])
+    chain_sampler = deepcopy(model.sampler)
+    chain_sampler.schedule.reset()
+    chain_model = deepcopy(model.model)
+    return chain_sampler.samples(chain_model,
                                  model.n_samples,
                                  model.n_burn,
                                  model.thin,
@@ -37,6 +49,17 @@ def delayed_run_chain():
     return run_chain
 
 
+def summed_prediction(models: List[Model], X: np.ndarray) -> np.ndarray:
+    """
+    Sum of the predictions of a set of models, accumulated into a single buffer
+    Primarily used as a building block for spreading out of sample prediction over several threads
+    """
+    prediction = np.zeros(X.shape[0], dtype=np.float64)
+    for model in models:
+        prediction += model.predict(X)
+    return prediction
+
+
 class SklearnModel(BaseEstimator, RegressorMixin):
     """
     The main access point to building BART models in BartPy
@@ -120,6 +143,7 @@ class SklearnModel(BaseEstimator, RegressorMixin):
         self.sampler = ModelSampler(self.schedule)
 
         self.sigma, self.data, self.model, self._prediction_samples, self._model_samples, self.extract = [None] * 6
+        self._mean_in_sample_prediction = None
 
     def fit(self, X: Union[np.ndarray, pd.DataFrame], y: np.ndarray) -> 'SklearnModel':
         """
@@ -137,11 +161,12 @@ class SklearnModel(BaseEstimator, RegressorMixin):
         SklearnModel
             self with trained parameter values
         """
-        self.model = self._construct_model(X, y)
         self.extract = Parallel(n_jobs=self.n_jobs)(self.f_delayed_chains(X, y))
         self.combined_chains = self._combine_chains(self.extract)
         self._model_samples, self._prediction_samples = self.combined_chains["model"], self.combined_chains["in_sample_predictions"]
         self._acceptance_trace = self.combined_chains["acceptance"]
+        if self.store_in_sample_predictions and len(self._prediction_samples) > 0:
+            self._mean_in_sample_prediction = self._prediction_samples.mean(axis=0)
         return self
 
     @staticmethod
@@ -149,16 +174,37 @@ class SklearnModel(BaseEstimator, RegressorMixin):
         keys = list(extract[0].keys())
         combined = {}
         for key in keys:
-            combined[key] = np.concatenate([chain[key] for chain in extract], axis=0)
+            samples = [chain[key] for chain in extract]
+            first_sample = next((x[0] for x in samples if len(x) > 0), None)
+            if isinstance(first_sample, np.ndarray):
+                combined[key] = SklearnModel._stack_samples(samples, first_sample)
+            else:
+                combined[key] = np.concatenate(samples, axis=0)
+        return combined
+
+    @staticmethod
+    def _stack_samples(samples: List[List[np.ndarray]], first_sample: np.ndarray) -> np.ndarray:
+        """
+        Stack the array samples of all chains into a single preallocated array
+        Avoids materializing an intermediate array per chain as `np.concatenate` would
+        """
+        total = sum(len(x) for x in samples)
+        combined = np.empty((total,) + first_sample.shape, dtype=first_sample.dtype)
+        offset = 0
+        for chain_samples in samples:
+            for sample in chain_samples:
+                combined[offset] = sample
+                offset += 1
         return combined
 
     @staticmethod
     def _convert_covariates_to_data(X: np.ndarray, y: np.ndarray) -> Data:
-        from copy import deepcopy
         if type(X) == pd.DataFrame:
             X: pd.DataFrame = X
             X = X.values
-        return Data(deepcopy(X), deepcopy(y), normalize=True)
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.ascontiguousarray(y, dtype=np.float64)
+        return Data(X, y, normalize=True)
 
     def _construct_model(self, X: np.ndarray, y: np.ndarray) -> Model:
         if len(X) == 0 or X.shape[1] == 0:
@@ -179,6 +225,8 @@ class SklearnModel(BaseEstimator, RegressorMixin):
         Useful for when you want to run multiple instances of the model in parallel
         e.g. when calculating a null distribution for feature importance
 
+        The model is constructed from X and y once here and shared by all of the chains
+
         Parameters
         ----------
         X: np.ndarray
@@ -190,7 +238,9 @@ class SklearnModel(BaseEstimator, RegressorMixin):
         -------
         List[Callable[[], ChainExtract]]
         """
-        return [delayed(x)(self, X, y) for x in self.f_chains()]
+        self.model = self._construct_model(X, y)
+        seeds = np.random.SeedSequence(np.random.randint(np.iinfo(np.int32).max)).spawn(self.n_chains)
+        return [delayed(x)(self, seed) for x, seed in zip(self.f_chains(), seeds)]
 
     def f_chains(self) -> List[Callable[[], Chain]]:
         """
@@ -223,7 +273,10 @@ class SklearnModel(BaseEstimator, RegressorMixin):
             predictions for the X covariates
         """
         if X is None and self.store_in_sample_predictions:
-            return self.data.y.unnormalize_y(np.mean(self._prediction_samples, axis=0))
+            if self._mean_in_sample_prediction is None:
+                raise ValueError(
+                    "No in sample prediction samples stored.  Either fit the model first or increase n_samples / thin so that at least one sample is stored")
+            return self.data.y.unnormalize_y(self._mean_in_sample_prediction)
         elif X is None and not self.store_in_sample_predictions:
             raise ValueError(
                 "In sample predictions only possible if model.store_in_sample_predictions is `True`.  Either set the parameter to True or pass a non-None X parameter")
@@ -285,10 +338,26 @@ class SklearnModel(BaseEstimator, RegressorMixin):
         float
             The total summed L2 error for the model
         """
-        return np.sqrt(np.sum(self.l2_error(X, y)))
+        return math.sqrt(self._l2_sum(X, y))
+
+    def _l2_sum(self, X=None, y=None) -> float:
+        """
+        Sum of squared errors over all observations, computed without materializing the squared residuals
+        """
+        residuals = self.residuals(X, y)
+        return float(residuals @ residuals)
 
     def _out_of_sample_predict(self, X):
-        return self.data.y.unnormalize_y(np.mean([x.predict(X) for x in self._model_samples], axis=0))
+        if self._model_samples is None or len(self._model_samples) == 0:
+            raise ValueError(
+                "No model samples to predict from.  Either fit the model first or increase n_samples / thin so that at least one sample is stored")
+        n_chunks = min(effective_n_jobs(self.n_jobs), len(self._model_samples))
+        chunks = np.array_split(np.arange(len(self._model_samples)), n_chunks)
+        summed_predictions = Parallel(n_jobs=n_chunks, backend="threading")(
+            delayed(summed_prediction)([self._model_samples[i] for i in chunk], X) for chunk in chunks)
+        prediction = np.add.reduce(summed_predictions)
+        prediction /= len(self._model_samples)
+        return self.data.y.unnormalize_y(prediction)
 
     def fit_predict(self, X, y):
         self.fit(X, y)
@@ -338,7 +407,7 @@ class SklearnModel(BaseEstimator, RegressorMixin):
         np.ndarray
             prediction samples with dimensionality n_samples * n_points
         """
-        return self.prediction_samples
+        return self._prediction_samples
 
     def from_extract(self, extract: List[Chain], X: np.ndarray, y: np.ndarray) -> 'SklearnModel':
         """
@@ -360,7 +429,9 @@ class SklearnModel(BaseEstimator, RegressorMixin):
         """
         new_model = deepcopy(self)
         combined_chain = self._combine_chains(extract)
-        self._model_samples, self._prediction_samples = combined_chain["model"], combined_chain["in_sample_predictions"]
-        self._acceptance_trace = combined_chain["acceptance"]
+        new_model._model_samples, new_model._prediction_samples = combined_chain["model"], combined_chain["in_sample_predictions"]
+        new_model._acceptance_trace = combined_chain["acceptance"]
+        if new_model.store_in_sample_predictions and len(new_model._prediction_samples) > 0:
+            new_model._mean_in_sample_prediction = new_model._prediction_samples.mean(axis=0)
         new_model.data = self._convert_covariates_to_data(X, y)
         return new_model
@@ -14,6 +14,7 @@ setup(
     install_requires=[
         'joblib',
         'matplotlib',
+        'numba',
         'numpy',
         'pandas',
         'scipy',
@@ -5,6 +5,7 @@ import numpy as np
 
 from bartpy.data import CovariateMatrix, Data, Target, is_not_constant, format_covariate_matrix
 from bartpy.errors import NoSplittableVariableException
+from bartpy.kernels import masked_sum, min_max_normalize, min_max_unnormalize
 
 
 class TestIsNotConstant(unittest.TestCase):
@@ -34,11 +35,66 @@ class TestDataNormalization(unittest.TestCase):
         self.assertListEqual(list(self.y.unnormalized_y), self.y_raw)
         self.assertListEqual(list(self.y.unnormalize_y(np.array([0, 0.25, 0.5, 0.75]))), [3, 4, 5, 6])
 
+    def test_unnormalization_preserves_shape(self):
+        unnormalized = self.y.unnormalize_y(0.)
+        self.assertEqual(np.ndim(unnormalized), 0)
+        self.assertEqual(unnormalized, 3.)
+        self.assertEqual(self.y.unnormalize_y(np.zeros((2, 3))).shape, (2, 3))
+
     def test_normalization(self):
         self.assertEqual(-0.5, self.y.values.min())
         self.assertEqual(0.5, self.y.values.max())
 
 
+class TestMaskedSumKernel(unittest.TestCase):
+
+    def setUp(self):
+        self.y = np.array([1., 2., 3., 4., 5.])
+
+    def test_none_masked(self):
+        self.assertEqual(masked_sum(self.y, np.zeros(5, dtype=bool)), 15.)
+
+    def test_all_masked(self):
+        self.assertEqual(masked_sum(self.y, np.ones(5, dtype=bool)), 0.)
+
+    def test_mixed(self):
+        self.assertEqual(masked_sum(self.y, np.array([True, False, True, False, False])), 11.)
+
+
+class TestMinMaxNormalizeKernel(unittest.TestCase):
+
+    def test_round_trip(self):
+        y = np.array([3., -1.5, 10., 0.25, 7.])
+        normalized, y_min, y_max = min_max_normalize(y)
+        self.assertEqual((y_min, y_max), (-1.5, 10.))
+        self.assertEqual(normalized.min(), -0.5)
+        self.assertEqual(normalized.max(), 0.5)
+        self.assertTrue(np.allclose(min_max_unnormalize(normalized, y_min, y_max), y))
+
+    def test_unnormalize_round_trip(self):
+        y = np.array([-0.5, -0.1, 0.2, 0.5])
+        unnormalized = min_max_unnormalize(y, 2., 6.)
+        self.assertTrue(np.allclose(unnormalized, [2., 3.6, 4.8, 6.]))
+        normalized, _, _ = min_max_normalize(unnormalized)
+        self.assertTrue(np.allclose(normalized, y))
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            min_max_normalize(np.empty(0))
+
+    def test_constant(self):
+        normalized, y_min, y_max = min_max_normalize(np.array([2., 2., 2.]))
+        self.assertTrue(np.all(np.isnan(normalized)))
+        self.assertEqual((y_min, y_max), (2., 2.))
+
+    def test_nan(self):
+        for y in [np.array([1., np.nan, 3.]), np.array([np.nan, 1., 3.])]:
+            normalized, y_min, y_max = min_max_normalize(y)
+            self.assertTrue(np.all(np.isnan(normalized)))
+            self.assertTrue(np.isnan(y_min))
+            self.assertTrue(np.isnan(y_max))
+
+
 class TestTargetCaching(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,38 @@
+from operator import gt, le
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from bartpy.data import Data, format_covariate_matrix
+from bartpy.model import Model
+from bartpy.node import LeafNode, split_node
+from bartpy.samplers.leafnode import LeafNodeSampler
+from bartpy.sigma import Sigma
+from bartpy.split import Split
+from bartpy.splitcondition import SplitCondition
+
+
+class TestLeafNodeSampler(unittest.TestCase):
+
+    def setUp(self):
+        X = format_covariate_matrix(pd.DataFrame({"a": [1, 2, 3, 4, 5]}))
+        self.data = Data(X, np.array([1.0, 2.0, 3.0, 4.0, 5.0]), normalize=True)
+        self.model = Model(self.data, Sigma(0.001, 0.001, scaling_factor=self.data.y.normalizing_scale), n_trees=2, initializer=None)
+        node = split_node(LeafNode(Split(self.data)), (SplitCondition(0, 3, le), SplitCondition(0, 3, gt)))
+        self.leaf_nodes = [node.left_child, node.right_child]
+        self.sampler = LeafNodeSampler()
+
+    def test_step_batch_sets_values(self):
+        sampled_values = self.sampler.step_batch(self.model, self.leaf_nodes)
+        self.assertEqual(len(sampled_values), 2)
+        for node, sampled_value in zip(self.leaf_nodes, sampled_values):
+            self.assertEqual(node.current_value, sampled_value)
+
+    def test_step_sets_value(self):
+        sampled_value = self.sampler.step(self.model, self.leaf_nodes[0])
+        self.assertEqual(self.leaf_nodes[0].current_value, sampled_value)
+
+
+if __name__ == '__main__':
+    unittest.main()
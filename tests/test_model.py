@@ -28,6 +28,16 @@ class TestSplitModel(unittest.TestCase):
         self.model.trees[0].update_y(updated_y)
         self.assertListEqual(list(self.model.trees[0].nodes[0].data.y.values), list(updated_y))
 
+    def test_trees_share_covariate_matrix(self):
+        for tree in self.model.trees:
+            self.assertIs(tree.nodes[0].data.X.values, self.model.data.X.values)
+
+    def test_tree_targets_updated_independently(self):
+        self.model.trees[0].update_y(np.ones(5))
+        self.model.trees[1].update_y(np.zeros(5))
+        self.assertEqual(self.model.trees[0].nodes[0].data.y.summed_y(), 5.)
+        self.assertEqual(self.model.trees[1].nodes[0].data.y.summed_y(), 0.)
+
     def test_trees_initialized_correctly(self):
         self.assertEqual(len(self.model.trees), 2)
         for tree in self.model.trees:
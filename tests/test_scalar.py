@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from bartpy.samplers.scalar import NormalScalarSampler
+
+
+class TestNormalScalarSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.sampler = NormalScalarSampler(10)
+        self.sampler.refresh_cache()
+        self.pool = self.sampler._cache
+
+    def test_sample_n_slices_pool(self):
+        draws = self.sampler.sample(4)
+        self.assertListEqual(list(draws), list(self.pool[:4]))
+        self.assertListEqual(list(self.sampler.sample(3)), list(self.pool[4:7]))
+
+    def test_cursor_advances(self):
+        self.sampler.sample()
+        self.assertEqual(self.sampler._cursor, 1)
+        self.sampler.sample(4)
+        self.assertEqual(self.sampler._cursor, 5)
+        self.assertEqual(self.sampler.sample(), self.pool[5])
+        self.assertEqual(self.sampler._cursor, 6)
+
+    def test_refill_when_n_exceeds_remaining(self):
+        self.sampler.sample(8)
+        draws = self.sampler.sample(5)
+        self.assertEqual(len(draws), 5)
+        self.assertIsNot(self.sampler._cache, self.pool)
+        self.assertListEqual(list(draws), list(self.sampler._cache[:5]))
+        self.assertEqual(self.sampler._cursor, 5)
+
+    def test_refill_larger_than_cache_size(self):
+        draws = self.sampler.sample(25)
+        self.assertEqual(len(draws), 25)
+        self.assertEqual(self.sampler._cursor, 25)
+
+    def test_reset_discards_pool(self):
+        self.sampler.reset()
+        self.assertEqual(self.sampler._cursor, 0)
+        self.assertEqual(len(self.sampler._cache), 0)
+        np.random.seed(0)
+        first_draws = np.array(self.sampler.sample(5))
+        self.sampler.reset()
+        np.random.seed(0)
+        self.assertListEqual(list(self.sampler.sample(5)), list(first_draws))
+
+
+if __name__ == '__main__':
+    unittest.main()
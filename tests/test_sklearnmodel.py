@@ -0,0 +1,95 @@
+import unittest
+import warnings
+
+import numpy as np
+
+from bartpy.samplers.modelsampler import ModelSampler
+from bartpy.sklearnmodel import SklearnModel
+
+
+class FirstLeafDrawsSampler(ModelSampler):
+    """
+    Stand in for a chain's sampler that returns the first leaf normals it would draw
+    """
+
+    def samples(self, model, *args, **kwargs):
+        return np.array(self.schedule.leaf_sampler._scalar_sampler.sample(5))
+
+
+class TestChainSeeding(unittest.TestCase):
+
+    def setUp(self):
+        self.X = np.random.normal(size=(20, 2))
+        self.y = self.X[:, 0]
+        self.model = SklearnModel(n_trees=2, n_chains=2, n_samples=0, n_burn=0, n_jobs=1, initializer=None)
+        self.model.sampler = FirstLeafDrawsSampler(self.model.schedule)
+        # Fill the sampler caches, as an earlier in-process fit would
+        self.scalar_sampler = self.model.schedule.leaf_sampler._scalar_sampler
+        self.scalar_sampler.sample()
+
+    def test_seeded_chains_draw_different_leaf_normals(self):
+        first_draws = [f(*args, **kwargs) for f, args, kwargs in self.model.f_delayed_chains(self.X, self.y)]
+        self.assertFalse(np.allclose(first_draws[0], first_draws[1]))
+
+    def test_chains_use_private_samplers(self):
+        cursor = self.scalar_sampler._cursor
+        for f, args, kwargs in self.model.f_delayed_chains(self.X, self.y):
+            f(*args, **kwargs)
+        self.assertEqual(self.scalar_sampler._cursor, cursor)
+
+
+class TestInSamplePrediction(unittest.TestCase):
+
+    def setUp(self):
+        self.X = np.random.normal(size=(20, 2))
+        self.y = self.X[:, 0]
+        self.model = SklearnModel(n_trees=2, n_chains=2, n_samples=10, n_burn=2, thin=0.5, n_jobs=1,
+                                  store_in_sample_predictions=True, initializer=None)
+
+    def test_prediction_samples(self):
+        self.model.fit(self.X, self.y)
+        self.assertEqual(self.model.prediction_samples.shape, (10, 20))
+
+    def test_predict_uses_cached_mean(self):
+        self.model.fit(self.X, self.y)
+        expected = self.model.data.y.unnormalize_y(self.model.prediction_samples.mean(axis=0))
+        self.model._prediction_samples = np.zeros_like(self.model._prediction_samples)
+        self.assertTrue(np.allclose(self.model.predict(), expected))
+
+    def test_from_extract(self):
+        extract = [f(*args, **kwargs) for f, args, kwargs in self.model.f_delayed_chains(self.X, self.y)]
+        new_model = self.model.from_extract(extract, self.X, self.y)
+        self.assertEqual(new_model.prediction_samples.shape, (10, 20))
+        self.assertEqual(len(new_model.model_samples), 10)
+        self.assertEqual(new_model.predict().shape, (20,))
+        self.assertEqual(new_model.predict(self.X).shape, (20,))
+
+
+class TestOutOfSamplePrediction(unittest.TestCase):
+
+    def setUp(self):
+        self.X = np.random.normal(size=(20, 2))
+        self.y = self.X[:, 0]
+
+    def test_unfitted_model(self):
+        with self.assertRaises(ValueError):
+            SklearnModel().predict(self.X)
+
+    def test_no_stored_samples(self):
+        model = SklearnModel(n_trees=2, n_chains=1, n_samples=0, n_burn=1, n_jobs=1, initializer=None)
+        model.fit(self.X, self.y)
+        with self.assertRaises(ValueError):
+            model.predict(self.X)
+
+    def test_no_stored_in_sample_predictions(self):
+        model = SklearnModel(n_trees=2, n_chains=1, n_samples=0, n_burn=1, n_jobs=1,
+                             store_in_sample_predictions=True, initializer=None)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            model.fit(self.X, self.y)
+        with self.assertRaises(ValueError):
+            model.predict()
+
+
+if __name__ == '__main__':
+    unittest.main()